@@ -7,18 +7,42 @@ Usage: python import_geojson.py --world <world_name>
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import mmap
+import os
 import re
+import struct
 import sys
 import uuid
-import xml.etree.ElementTree as ET
+from array import array
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import asyncpg
 
+try:
+    import ijson
+except ImportError:  # optional, features are read with a full parse when unavailable
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used when unavailable
+    orjson = None
+
+try:
+    from lxml import etree as ET
+except ImportError:  # optional speedup, stdlib ElementTree is API-compatible here
+    import xml.etree.ElementTree as ET
+
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -29,9 +53,19 @@ class DatabaseManager:
         self.database_url = database_url
         self._connection_pool = None
     
-    async def connect(self):
+    async def connect(
+        self,
+        min_size: int = 10,
+        max_size: int = 10,
+        server_settings: Optional[Dict[str, str]] = None,
+    ):
         """Initialize connection pool"""
-        self._connection_pool = await asyncpg.create_pool(self.database_url)
+        self._connection_pool = await asyncpg.create_pool(
+            self.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            server_settings=server_settings,
+        )
         logger.info("Database connection pool established")
     
     async def close(self):
@@ -40,20 +74,47 @@ class DatabaseManager:
             await self._connection_pool.close()
             logger.info("Database connection pool closed")
     
-    def transaction(self):
-        """Get a database transaction context"""
+    def connection(self):
+        """Get a pooled connection context (statements autocommit)"""
         return self._connection_pool.acquire()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Get a pooled connection with a transaction open for the duration of the context"""
+        async with self._connection_pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
 
 # Global database manager instance
 db_manager = DatabaseManager("postgresql://localhost/questables")
 
+# WKB is written in native byte order so coordinate arrays can be dumped directly
+_WKB_BYTE_ORDER = b'\x01' if sys.byteorder == 'little' else b'\x00'
+_WKB_UINT32 = struct.Struct('=I').pack
+# Rows sent per COPY so memory stays bounded when features are streamed
+_COPY_BATCH_SIZE = 5000
+# Batches parsed ahead of the COPY currently being sent
+_COPY_QUEUE_DEPTH = 4
+
+_WKB_TYPES = {
+    'Point': 1,
+    'LineString': 2,
+    'Polygon': 3,
+    'MultiPoint': 4,
+    'MultiLineString': 5,
+    'MultiPolygon': 6,
+}
+
+# Leading number of an SVG length such as "1024px" or "512.5"
+_NUMERIC_RE = re.compile(r"^-?\d+(?:\.\d+)?")
+
 
 def _parse_numeric(value: Optional[str]) -> Optional[float]:
     """Parse numeric (optionally unit-suffixed) SVG attribute values."""
     if value is None:
         return None
-    match = re.match(r"^-?\d+(?:\.\d+)?", value)
+    match = _NUMERIC_RE.match(value)
     if not match:
         return None
     try:
@@ -64,10 +125,18 @@ def _parse_numeric(value: Optional[str]) -> Optional[float]:
 
 def _extract_svg_dimensions(svg_path: Path) -> Tuple[int, int]:
     """Extract width/height (in pixels) from an SVG file, falling back to inkscape queries."""
+    # Only the root <svg> attributes are needed, so stop at the first start tag
+    # instead of building the whole document tree
+    root = None
     try:
-        root = ET.parse(svg_path).getroot()
+        with open(svg_path, 'rb') as f:
+            for _, elem in ET.iterparse(f, events=('start',)):
+                root = elem
+                break
     except Exception as exc:  # noqa: BLE001
         raise RuntimeError(f"Failed to parse SVG at {svg_path}: {exc}") from exc
+    if root is None:
+        raise RuntimeError(f"Failed to parse SVG at {svg_path}: no root element")
 
     width = _parse_numeric(root.attrib.get('width'))
     height = _parse_numeric(root.attrib.get('height'))
@@ -105,28 +174,36 @@ def _extract_svg_dimensions(svg_path: Path) -> Tuple[int, int]:
                     "Unable to determine SVG dimensions and inkscape is not available for fallback"
                 )
 
-            width_result = subprocess.run(
-                [inkscape_path, '--query-width', str(svg_path)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            height_result = subprocess.run(
-                [inkscape_path, '--query-height', str(svg_path)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            width = _parse_numeric(width_result.stdout.strip())
-            height = _parse_numeric(height_result.stdout.strip())
+            # Inkscape startup dominates each query, so run both processes side by side
+            queries = [
+                subprocess.Popen(
+                    [inkscape_path, flag, str(svg_path)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+                for flag in ('--query-width', '--query-height')
+            ]
+            results = []
+            for query in queries:
+                with query:
+                    results.append(query.communicate())
+            for query, (stdout, stderr) in zip(queries, results):
+                if query.returncode:
+                    raise subprocess.CalledProcessError(
+                        query.returncode, query.args, output=stdout, stderr=stderr
+                    )
+            (width_output, _), (height_output, _) = results
+
+            width = _parse_numeric(width_output.strip())
+            height = _parse_numeric(height_output.strip())
             logger.debug(
                 "Inkscape fallback dimensions for %s -> width=%s height=%s (raw: %r, %r)",
                 svg_path,
                 width,
                 height,
-                width_result.stdout,
-                height_result.stdout,
+                width_output,
+                height_output,
             )
         except Exception as fallback_exc:  # noqa: BLE001
             raise RuntimeError(
@@ -151,10 +228,15 @@ def _find_world_svg(world_name: str, world_files: Dict[str, Path]) -> Path:
     ]
 
     for directory in candidate_dirs:
+        # One directory listing instead of a stat per preferred name
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
         for name in preferred_names:
-            svg_path = directory / name
-            if svg_path.exists():
-                return svg_path
+            if name in names:
+                return directory / name
 
     raise FileNotFoundError(
         f"Unable to locate SVG for world '{world_name}'. Searched directories: "
@@ -162,17 +244,29 @@ def _find_world_svg(world_name: str, world_files: Dict[str, Path]) -> Path:
     )
 
 
+def _read_meters_per_pixel(path: Path) -> Any:
+    """Return the raw metadata.scale.meters_per_pixel value of a GeoJSON file, if any."""
+    if ijson is not None:
+        # Stream just the scalar rather than parsing every feature up front
+        with open(path, 'rb') as f:
+            for value in ijson.items(f, 'metadata.scale.meters_per_pixel', use_float=True):
+                return value
+        return None
+
+    data = _read_geojson(path)
+    metadata = data.get('metadata') or {}
+    scale = metadata.get('scale') if isinstance(metadata, dict) else None
+    return scale.get('meters_per_pixel') if isinstance(scale, dict) else None
+
+
 def _extract_scale_info(world_files: Dict[str, Path]) -> Optional[float]:
     """Grab meters_per_pixel from any GeoJSON metadata block."""
     for path in world_files.values():
         try:
-            data = _read_geojson(path)
+            meters_per_pixel = _read_meters_per_pixel(path)
         except Exception:
             continue
 
-        metadata = data.get('metadata') or {}
-        scale = metadata.get('scale') if isinstance(metadata, dict) else None
-        meters_per_pixel = scale.get('meters_per_pixel') if isinstance(scale, dict) else None
         if meters_per_pixel is not None:
             try:
                 return float(meters_per_pixel)
@@ -185,7 +279,19 @@ def _extract_scale_info(world_files: Dict[str, Path]) -> Optional[float]:
     return None
 
 
-def _build_map_metadata(world_name: str, world_files: Dict[str, Path]) -> Tuple[Dict[str, Any], Path]:
+@dataclass(slots=True)
+class MapMetadata:
+    """Canonical map metadata; field order matches the written *_mapinfo.json"""
+    world: str
+    generated_at: str
+    source_svg: str
+    width_pixels: int
+    height_pixels: int
+    meters_per_pixel: float
+    bounds: Dict[str, Any]
+
+
+def _build_map_metadata(world_name: str, world_files: Dict[str, Path]) -> Tuple[MapMetadata, Path]:
     """Construct canonical map metadata shared by the database and tile pipeline."""
     meters_per_pixel = _extract_scale_info(world_files)
     if meters_per_pixel is None:
@@ -213,35 +319,60 @@ def _build_map_metadata(world_name: str, world_files: Dict[str, Path]) -> Tuple[
         "meters_per_pixel": meters_per_pixel,
     }
 
-    metadata = {
-        "world": world_name,
-        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        "source_svg": str(svg_path.resolve()),
-        "width_pixels": width_pixels,
-        "height_pixels": height_pixels,
-        "meters_per_pixel": meters_per_pixel,
-        "bounds": bounds,
-    }
+    metadata = MapMetadata(
+        world=world_name,
+        generated_at=datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        source_svg=str(svg_path.resolve()),
+        width_pixels=width_pixels,
+        height_pixels=height_pixels,
+        meters_per_pixel=meters_per_pixel,
+        bounds=bounds,
+    )
 
     metadata_path = svg_path.with_name(f"{world_name}_mapinfo.json")
     return metadata, metadata_path
 
 
-def _write_metadata_file(metadata: Dict[str, Any], metadata_path: Path) -> None:
+def _write_metadata_file(metadata: MapMetadata, metadata_path: Path) -> None:
     """Persist canonical metadata for downstream consumers (tile renderer, etc.)."""
     try:
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        metadata_path.write_text(json.dumps(metadata, indent=2))
+        metadata_path.write_text(json.dumps(asdict(metadata), indent=2))
         logger.info("Saved map metadata to %s", metadata_path)
     except Exception as exc:  # noqa: BLE001
         raise RuntimeError(f"Failed to write metadata file {metadata_path}: {exc}") from exc
 
 
+def _json_loads(raw: Union[bytes, memoryview]) -> Any:
+    """Parse a JSON buffer, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to compact JSON text, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+
+@lru_cache(maxsize=16)
+def _load_geojson(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a GeoJSON file; cached per (path, mtime) so repeat reads share one parse"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _json_loads(b'')
+        # Parse straight from the page cache instead of copying the file into a bytes object
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
+
+
 def _read_geojson(path: Path) -> Dict[str, Any]:
     """Read and parse a GeoJSON file"""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        resolved = Path(path).resolve()
+        data = _load_geojson(str(resolved), resolved.stat().st_mtime_ns)
         logger.debug(f"Successfully read {path.name}")
         return data
     except Exception as e:
@@ -249,33 +380,166 @@ def _read_geojson(path: Path) -> Dict[str, Any]:
         raise
 
 
-def _safe_str(value: Any) -> Optional[str]:
+def _iter_features(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield GeoJSON features one at a time, streaming the file with ijson when available"""
+    if ijson is None:
+        yield from _read_geojson(path).get('features', [])
+        return
+
+    try:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'features.item', use_float=True)
+    except Exception as e:
+        logger.error(f"Failed to read {path}: {e}")
+        raise
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _wkb_coords(points: List[List[float]]) -> bytes:
+    """Encode a point count followed by packed x/y doubles"""
+    coords = array('d', chain.from_iterable(points))
+    if len(coords) != 2 * len(points):
+        # Drop Z/M ordinates; the map tables store 2D geometries
+        coords = array('d', chain.from_iterable(point[:2] for point in points))
+    return _WKB_UINT32(len(points)) + coords.tobytes()
+
+
+def _write_wkb(geom_type: str, coordinates: Any, out: List[bytes]) -> None:
+    """Append the WKB encoding of a GeoJSON type/coordinates pair to out"""
+    try:
+        out.append(_WKB_BYTE_ORDER + _WKB_UINT32(_WKB_TYPES[geom_type]))
+    except KeyError:
+        raise ValueError(f"Unsupported geometry type: {geom_type}") from None
+
+    if geom_type == 'Point':
+        out.append(array('d', coordinates[:2]).tobytes())
+    elif geom_type == 'LineString':
+        out.append(_wkb_coords(coordinates))
+    elif geom_type == 'Polygon':
+        out.append(_WKB_UINT32(len(coordinates)))
+        out.extend(_wkb_coords(ring) for ring in coordinates)
+    else:
+        part_type = geom_type[len('Multi'):]
+        out.append(_WKB_UINT32(len(coordinates)))
+        for part in coordinates:
+            _write_wkb(part_type, part, out)
+
+
+def _geojson_to_wkb(geometry: Optional[Dict[str, Any]], as_multi: bool = False) -> Optional[bytes]:
+    """Convert a GeoJSON geometry dict to WKB so PostGIS can skip JSON parsing"""
+    if geometry is None:
+        return None
+    geom_type = geometry['type']
+    coordinates = geometry['coordinates']
+    if as_multi and not geom_type.startswith('Multi'):
+        # Wrap single parts here so the Multi* columns need no ST_Multi on the server
+        geom_type, coordinates = f"Multi{geom_type}", [coordinates]
+    out: List[bytes] = []
+    _write_wkb(geom_type, coordinates, out)
+    return b''.join(out)
+
+
+def _safe_str(value: Any, _str: Callable[[Any], str] = str) -> Optional[str]:
     """Safely convert value to string, handling None and encoding issues"""
+    # _str binds the builtin at definition time; this runs once per text column per feature
     if value is None:
         return None
     try:
-        # Convert to string and handle unicode surrogates
-        text = str(value)
-        # Remove or replace problematic unicode surrogates
-        text = text.encode('utf-8', 'ignore').decode('utf-8')
-        return text
+        # Convert to string (str values pass through)
+        text = value if type(value) is _str else _str(value)
     except Exception:
         return None
+    try:
+        # Clean text needs no round-trip; encoding only fails on unicode surrogates
+        text.encode('utf-8')
+        return text
+    except UnicodeEncodeError:
+        return text.encode('utf-8', 'ignore').decode('utf-8')
+
+
+async def _drop_secondary_indexes(conn: asyncpg.Connection, table: str) -> List[str]:
+    """Drop the non-unique, non-constraint indexes of an empty table, returning the SQL to recreate them"""
+    # A first import into an empty table builds each index once after the merge instead of
+    # maintaining it row by row; tables that already hold worlds keep their indexes online
+    if await conn.fetchval(f"SELECT EXISTS (SELECT 1 FROM {table})"):
+        return []
+
+    indexes = await conn.fetch(
+        """
+        SELECT i.indexrelid::regclass::text AS name, pg_get_indexdef(i.indexrelid) AS definition
+        FROM pg_index i
+        WHERE i.indrelid = $1::regclass
+          AND NOT i.indisprimary
+          AND NOT i.indisunique
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """,
+        table,
+    )
+    for index in indexes:
+        await conn.execute(f"DROP INDEX {index['name']}")
+    return [index['definition'] for index in indexes]
+
+
+async def _copy_upsert(
+    conn: asyncpg.Connection,
+    target_table: str,
+    stage_table: str,
+    stage_columns: List[Tuple[str, str]],
+    batches: Iterable[List[Tuple[Any, ...]]],
+    merge_sql: str,
+    world_id: str,
+) -> int:
+    """Bulk-load record batches into a temp staging table via COPY, then merge into the target table
+
+    Must run inside a transaction (see DatabaseManager.transaction); the staging
+    table is dropped when it commits.
+    """
+    column_ddl = ", ".join(f"{name} {pg_type}" for name, pg_type in stage_columns)
+    columns = [name for name, _ in stage_columns]
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_COPY_QUEUE_DEPTH)
+
+    async def produce() -> None:
+        # Build the next batches in a worker thread while the previous COPY is still in flight,
+        # keeping the event loop free to drive the other ingests' connections
+        iterator = iter(batches)
+        try:
+            while (batch := await asyncio.to_thread(next, iterator, None)) is not None:
+                await queue.put(batch)
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(None)
 
+    rows = 0
+    # ordinal numbers the rows in COPY order, so merges can keep the last row per feature id
+    await conn.execute(
+        f"CREATE TEMP TABLE {stage_table} ({column_ddl}, ordinal bigint GENERATED ALWAYS AS IDENTITY) "
+        "ON COMMIT DROP"
+    )
+    producer = asyncio.create_task(produce())
+    try:
+        while (batch := await queue.get()) is not None:
+            if isinstance(batch, Exception):
+                raise batch
+            await conn.copy_records_to_table(stage_table, records=batch, columns=columns)
+            rows += len(batch)
+    finally:
+        producer.cancel()
+    rebuild_sql = await _drop_secondary_indexes(conn, target_table)
+    await conn.execute(merge_sql, world_id)
+    for index_sql in rebuild_sql:
+        await conn.execute(index_sql)
+    return rows
 
-async def create_world_entry(world_name: str, metadata: Dict[str, Any]) -> str:
-    """Create or update the maps_world entry using canonical metadata."""
-    bounds = metadata.get('bounds', {})
-    width_pixels = metadata.get('width_pixels')
-    height_pixels = metadata.get('height_pixels')
-    meters_per_pixel = metadata.get('meters_per_pixel')
-
-    if not isinstance(width_pixels, (int, float)) or not isinstance(height_pixels, (int, float)):
-        raise RuntimeError("Map metadata missing width/height information")
-
-    if not isinstance(meters_per_pixel, (int, float)):
-        raise RuntimeError("Map metadata missing meters_per_pixel information")
 
+async def create_world_entry(world_name: str, metadata: MapMetadata) -> str:
+    """Create or update the maps_world entry using canonical metadata."""
     # First try to find existing world
     select_sql = "SELECT id FROM public.maps_world WHERE name = $1"
     
@@ -299,10 +563,10 @@ async def create_world_entry(world_name: str, metadata: Dict[str, Any]) -> str:
                 update_sql,
                 world_id,
                 f"Imported world map: {world_name}",
-                json.dumps(bounds),
-                int(width_pixels),
-                int(height_pixels),
-                float(meters_per_pixel)
+                _json_dumps(metadata.bounds),
+                metadata.width_pixels,
+                metadata.height_pixels,
+                metadata.meters_per_pixel
             )
             logger.info(f"Updated existing world '{world_name}' with ID: {world_id}")
         else:
@@ -326,10 +590,10 @@ async def create_world_entry(world_name: str, metadata: Dict[str, Any]) -> str:
                 world_id,
                 world_name,
                 f"Imported world map: {world_name}",
-                json.dumps(bounds),
-                int(width_pixels),
-                int(height_pixels),
-                float(meters_per_pixel),
+                _json_dumps(metadata.bounds),
+                metadata.width_pixels,
+                metadata.height_pixels,
+                metadata.meters_per_pixel,
                 True
             )
             logger.info(f"Created new world '{world_name}' with ID: {world_id}")
@@ -337,217 +601,388 @@ async def create_world_entry(world_name: str, metadata: Dict[str, Any]) -> str:
         return world_id
 
 
+def _opt_float(value: Any) -> Optional[float]:
+    """Convert to float, keeping None as NULL"""
+    return None if value is None else float(value)
+
+
+def _opt_json(value: Any) -> Optional[str]:
+    """Serialize to JSON text, keeping None as NULL"""
+    return None if value is None else _json_dumps(value)
+
+
+def _uuid4_batch(count: int) -> List[uuid.UUID]:
+    """Generate random (version 4) UUIDs from a single urandom read"""
+    # asyncpg binds uuid.UUID directly, so no string formatting is needed
+    raw = os.urandom(16 * count)
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
+def _record_builder(
+    fields: Tuple[Tuple[str, Any, Callable[[Any], Any]], ...],
+    as_multi: bool = False,
+) -> Callable[[List[Dict[str, Any]]], List[Tuple[Any, ...]]]:
+    """Build a function turning a batch of features into staging records (id, *fields, geom)"""
+    keys = tuple(key for key, _, _ in fields)
+    defaults = tuple(default for _, default, _ in fields)
+    casts = tuple(cast for _, _, cast in fields)
+    getter = itemgetter(*keys)
+
+    def extract(properties: Dict[str, Any]) -> Tuple[Any, ...]:
+        try:
+            return getter(properties)
+        except KeyError:
+            # Some optional properties are absent, fall back to per-key defaults
+            return tuple(map(properties.get, keys, defaults))
+
+    def build(features: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        values = [extract(f.get("properties") or _EMPTY_PROPERTIES) for f in features]
+        # Coerce column-wise so each cast runs as one C-level map over the batch
+        columns = [map(cast, column) for cast, column in zip(casts, zip(*values))]
+        ids = _uuid4_batch(len(features))
+        geoms = [_geojson_to_wkb(f.get("geometry"), as_multi) for f in features]
+        return list(zip(ids, *columns, geoms))
+
+    return build
+
+
+# Shared stand-in for features without properties; only ever read
+_EMPTY_PROPERTIES: Dict[str, Any] = {}
+
+# (property, default when missing, cast) for each staged column between id and geom
+_CELL_FIELDS = (
+    ("id", None, int),                       # cell_id (INTEGER)
+    ("biome", 0, int),                       # biome (INTEGER)
+    ("type", None, _safe_str),               # type (TEXT)
+    ("population", 0, int),                  # population (INTEGER)
+    ("state", 0, int),                       # state (INTEGER)
+    ("culture", 0, int),                     # culture (INTEGER)
+    ("religion", 0, int),                    # religion (INTEGER)
+    ("height", 0, int),                      # height (INTEGER)
+)
+
+_BURG_FIELDS = (
+    ("id", None, int),                       # burg_id (INTEGER)
+    ("name", None, _safe_str),               # name (TEXT)
+    ("state", None, _safe_str),              # state (TEXT)
+    ("stateFull", None, _safe_str),          # statefull (TEXT)
+    ("province", None, _safe_str),           # province (TEXT)
+    ("provinceFull", None, _safe_str),       # provincefull (TEXT)
+    ("culture", None, _safe_str),            # culture (TEXT)
+    ("religion", None, _safe_str),           # religion (TEXT)
+    ("population", 0, int),                  # population (INTEGER)
+    ("populationRaw", 0.0, float),           # populationraw (DOUBLE PRECISION)
+    ("elevation", 0, int),                   # elevation (INTEGER)
+    ("temperature", None, _safe_str),        # temperature (TEXT)
+    ("temperatureLikeness", None, _safe_str),  # temperaturelikeness (TEXT)
+    ("capital", False, bool),                # capital (BOOLEAN)
+    ("port", False, bool),                   # port (BOOLEAN)
+    ("citadel", False, bool),                # citadel (BOOLEAN)
+    ("walls", False, bool),                  # walls (BOOLEAN)
+    ("plaza", False, bool),                  # plaza (BOOLEAN)
+    ("temple", False, bool),                 # temple (BOOLEAN)
+    ("shanty", False, bool),                 # shanty (BOOLEAN)
+    ("xWorld", 0, int),                      # xworld (INTEGER)
+    ("yWorld", 0, int),                      # yworld (INTEGER)
+    ("xPixel", 0.0, float),                  # xpixel (DOUBLE PRECISION)
+    ("yPixel", 0.0, float),                  # ypixel (DOUBLE PRECISION)
+    ("cell", 0, int),                        # cell (INTEGER)
+    ("emblem", None, _opt_json),             # emblem (JSONB text)
+)
+
+_ROUTE_FIELDS = (
+    ("id", None, int),                       # route_id (INTEGER)
+    ("name", None, _safe_str),               # name (TEXT)
+    ("type", None, _safe_str),               # type (TEXT)
+    ("feature", 0, int),                     # feature (INTEGER)
+)
+
+_RIVER_FIELDS = (
+    ("id", None, int),                       # river_id (INTEGER)
+    ("name", None, _safe_str),               # name (TEXT)
+    ("type", None, _safe_str),               # type (TEXT)
+    ("discharge", None, _opt_float),         # discharge (DOUBLE PRECISION)
+    ("length", None, _opt_float),            # length (DOUBLE PRECISION)
+    ("width", None, _opt_float),             # width (DOUBLE PRECISION)
+)
+
+_MARKER_FIELDS = (
+    ("id", None, int),                       # marker_id (INTEGER)
+    ("type", None, _safe_str),               # type (TEXT)
+    ("icon", None, _safe_str),               # icon (TEXT)
+    ("x_px", None, _opt_float),              # x_px (DOUBLE PRECISION)
+    ("y_px", None, _opt_float),              # y_px (DOUBLE PRECISION)
+    ("note", None, _safe_str),               # note (TEXT)
+)
+
+_build_cell_records = _record_builder(_CELL_FIELDS, as_multi=True)
+_build_burg_records = _record_builder(_BURG_FIELDS)
+_build_route_records = _record_builder(_ROUTE_FIELDS, as_multi=True)
+_build_river_records = _record_builder(_RIVER_FIELDS, as_multi=True)
+_build_marker_records = _record_builder(_MARKER_FIELDS)
+
+# Staging table layouts and the merge statements that upsert them into the map tables.
+# A file may repeat a feature id; like the per-row upsert did, the last occurrence wins
+_CELLS_STAGE_COLUMNS = [
+    ("id", "uuid"),
+    ("cell_id", "integer"),
+    ("biome", "integer"),
+    ("type", "text"),
+    ("population", "integer"),
+    ("state", "integer"),
+    ("culture", "integer"),
+    ("religion", "integer"),
+    ("height", "integer"),
+    ("geom_wkb", "bytea"),
+]
+
+_CELLS_MERGE_SQL = """
+    INSERT INTO public.maps_cells (id, world_id, cell_id, biome, type, population, state, culture, religion, height, geom)
+    SELECT DISTINCT ON (cell_id) id, $1::uuid, cell_id, biome, type, population, state, culture, religion, height,
+        ST_GeomFromWKB(geom_wkb, 0)
+    FROM _cells_stage
+    ORDER BY cell_id, ordinal DESC
+    ON CONFLICT (world_id, cell_id) DO UPDATE SET
+        biome=EXCLUDED.biome, type=EXCLUDED.type, population=EXCLUDED.population,
+        state=EXCLUDED.state, culture=EXCLUDED.culture, religion=EXCLUDED.religion,
+        height=EXCLUDED.height, geom=EXCLUDED.geom
+    WHERE (maps_cells.biome, maps_cells.type, maps_cells.population, maps_cells.state,
+        maps_cells.culture, maps_cells.religion, maps_cells.height, maps_cells.geom)
+        IS DISTINCT FROM (EXCLUDED.biome, EXCLUDED.type, EXCLUDED.population, EXCLUDED.state,
+        EXCLUDED.culture, EXCLUDED.religion, EXCLUDED.height, EXCLUDED.geom)
+"""
+
+
+_BURGS_STAGE_COLUMNS = [
+    ("id", "uuid"),
+    ("burg_id", "integer"),
+    ("name", "text"),
+    ("state", "text"),
+    ("statefull", "text"),
+    ("province", "text"),
+    ("provincefull", "text"),
+    ("culture", "text"),
+    ("religion", "text"),
+    ("population", "integer"),
+    ("populationraw", "double precision"),
+    ("elevation", "integer"),
+    ("temperature", "text"),
+    ("temperaturelikeness", "text"),
+    ("capital", "boolean"),
+    ("port", "boolean"),
+    ("citadel", "boolean"),
+    ("walls", "boolean"),
+    ("plaza", "boolean"),
+    ("temple", "boolean"),
+    ("shanty", "boolean"),
+    ("xworld", "integer"),
+    ("yworld", "integer"),
+    ("xpixel", "double precision"),
+    ("ypixel", "double precision"),
+    ("cell", "integer"),
+    ("emblem", "text"),
+    ("geom_wkb", "bytea"),
+]
+
+_BURGS_MERGE_SQL = """
+    INSERT INTO public.maps_burgs (id, world_id, burg_id, name, state, statefull, province, provincefull,
+        culture, religion, population, populationraw, elevation, temperature, temperaturelikeness,
+        capital, port, citadel, walls, plaza, temple, shanty, xworld, yworld, xpixel, ypixel,
+        cell, emblem, geom)
+    SELECT DISTINCT ON (burg_id) id, $1::uuid, burg_id, name, state, statefull, province, provincefull,
+        culture, religion, population, populationraw, elevation, temperature, temperaturelikeness,
+        capital, port, citadel, walls, plaza, temple, shanty, xworld, yworld, xpixel, ypixel,
+        cell, emblem::jsonb, ST_GeomFromWKB(geom_wkb, 0)
+    FROM _burgs_stage
+    ORDER BY burg_id, ordinal DESC
+    ON CONFLICT (world_id, burg_id) DO UPDATE SET
+        name=EXCLUDED.name, state=EXCLUDED.state, statefull=EXCLUDED.statefull,
+        province=EXCLUDED.province, provincefull=EXCLUDED.provincefull, culture=EXCLUDED.culture,
+        religion=EXCLUDED.religion, population=EXCLUDED.population, populationraw=EXCLUDED.populationraw,
+        elevation=EXCLUDED.elevation, temperature=EXCLUDED.temperature,
+        temperaturelikeness=EXCLUDED.temperaturelikeness, capital=EXCLUDED.capital,
+        port=EXCLUDED.port, citadel=EXCLUDED.citadel, walls=EXCLUDED.walls, plaza=EXCLUDED.plaza,
+        temple=EXCLUDED.temple, shanty=EXCLUDED.shanty, xworld=EXCLUDED.xworld, yworld=EXCLUDED.yworld,
+        xpixel=EXCLUDED.xpixel, ypixel=EXCLUDED.ypixel, cell=EXCLUDED.cell, emblem=EXCLUDED.emblem,
+        geom=EXCLUDED.geom
+    WHERE (maps_burgs.name, maps_burgs.state, maps_burgs.statefull, maps_burgs.province,
+        maps_burgs.provincefull, maps_burgs.culture, maps_burgs.religion, maps_burgs.population,
+        maps_burgs.populationraw, maps_burgs.elevation, maps_burgs.temperature,
+        maps_burgs.temperaturelikeness, maps_burgs.capital, maps_burgs.port, maps_burgs.citadel,
+        maps_burgs.walls, maps_burgs.plaza, maps_burgs.temple, maps_burgs.shanty,
+        maps_burgs.xworld, maps_burgs.yworld, maps_burgs.xpixel, maps_burgs.ypixel,
+        maps_burgs.cell, maps_burgs.emblem, maps_burgs.geom)
+        IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.state, EXCLUDED.statefull, EXCLUDED.province,
+        EXCLUDED.provincefull, EXCLUDED.culture, EXCLUDED.religion, EXCLUDED.population,
+        EXCLUDED.populationraw, EXCLUDED.elevation, EXCLUDED.temperature,
+        EXCLUDED.temperaturelikeness, EXCLUDED.capital, EXCLUDED.port, EXCLUDED.citadel,
+        EXCLUDED.walls, EXCLUDED.plaza, EXCLUDED.temple, EXCLUDED.shanty, EXCLUDED.xworld,
+        EXCLUDED.yworld, EXCLUDED.xpixel, EXCLUDED.ypixel, EXCLUDED.cell, EXCLUDED.emblem,
+        EXCLUDED.geom)
+"""
+
+
+_ROUTES_STAGE_COLUMNS = [
+    ("id", "uuid"),
+    ("route_id", "integer"),
+    ("name", "text"),
+    ("type", "text"),
+    ("feature", "integer"),
+    ("geom_wkb", "bytea"),
+]
+
+_ROUTES_MERGE_SQL = """
+    INSERT INTO public.maps_routes (id, world_id, route_id, name, type, feature, geom)
+    SELECT DISTINCT ON (route_id) id, $1::uuid, route_id, name, type, feature,
+        ST_GeomFromWKB(geom_wkb, 0)
+    FROM _routes_stage
+    ORDER BY route_id, ordinal DESC
+    ON CONFLICT (world_id, route_id) DO UPDATE SET
+        name=EXCLUDED.name, type=EXCLUDED.type, feature=EXCLUDED.feature, geom=EXCLUDED.geom
+    WHERE (maps_routes.name, maps_routes.type, maps_routes.feature, maps_routes.geom)
+        IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.type, EXCLUDED.feature, EXCLUDED.geom)
+"""
+
+
+_RIVERS_STAGE_COLUMNS = [
+    ("id", "uuid"),
+    ("river_id", "integer"),
+    ("name", "text"),
+    ("type", "text"),
+    ("discharge", "double precision"),
+    ("length", "double precision"),
+    ("width", "double precision"),
+    ("geom_wkb", "bytea"),
+]
+
+_RIVERS_MERGE_SQL = """
+    INSERT INTO public.maps_rivers (id, world_id, river_id, name, type, discharge, length, width, geom)
+    SELECT DISTINCT ON (river_id) id, $1::uuid, river_id, name, type, discharge, length, width,
+        ST_GeomFromWKB(geom_wkb, 0)
+    FROM _rivers_stage
+    ORDER BY river_id, ordinal DESC
+    ON CONFLICT (world_id, river_id) DO UPDATE SET
+        name=EXCLUDED.name, type=EXCLUDED.type, discharge=EXCLUDED.discharge,
+        length=EXCLUDED.length, width=EXCLUDED.width, geom=EXCLUDED.geom
+    WHERE (maps_rivers.name, maps_rivers.type, maps_rivers.discharge, maps_rivers.length,
+        maps_rivers.width, maps_rivers.geom)
+        IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.type, EXCLUDED.discharge, EXCLUDED.length,
+        EXCLUDED.width, EXCLUDED.geom)
+"""
+
+
+_MARKERS_STAGE_COLUMNS = [
+    ("id", "uuid"),
+    ("marker_id", "integer"),
+    ("type", "text"),
+    ("icon", "text"),
+    ("x_px", "double precision"),
+    ("y_px", "double precision"),
+    ("note", "text"),
+    ("geom_wkb", "bytea"),
+]
+
+_MARKERS_MERGE_SQL = """
+    INSERT INTO public.maps_markers (id, world_id, marker_id, type, icon, x_px, y_px, note, geom)
+    SELECT DISTINCT ON (marker_id) id, $1::uuid, marker_id, type, icon, x_px, y_px, note,
+        ST_GeomFromWKB(geom_wkb, 0)
+    FROM _markers_stage
+    ORDER BY marker_id, ordinal DESC
+    ON CONFLICT (world_id, marker_id) DO UPDATE SET
+        type=EXCLUDED.type, icon=EXCLUDED.icon, x_px=EXCLUDED.x_px, y_px=EXCLUDED.y_px,
+        note=EXCLUDED.note, geom=EXCLUDED.geom
+    WHERE (maps_markers.type, maps_markers.icon, maps_markers.x_px, maps_markers.y_px,
+        maps_markers.note, maps_markers.geom)
+        IS DISTINCT FROM (EXCLUDED.type, EXCLUDED.icon, EXCLUDED.x_px, EXCLUDED.y_px,
+        EXCLUDED.note, EXCLUDED.geom)
+"""
+
+
 async def ingest_cells(path: Path, world_id: str) -> int:
     """Import cells data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting cells from {path.name} ({len(data.get('features', []))} features)")
-    
-    insert_sql = """
-        INSERT INTO public.maps_cells (id, world_id, cell_id, biome, type, population, state, culture, religion, height, geom) 
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($11)), 0))
-        ON CONFLICT (world_id, cell_id) DO UPDATE SET 
-            biome=EXCLUDED.biome, type=EXCLUDED.type, population=EXCLUDED.population,
-            state=EXCLUDED.state, culture=EXCLUDED.culture, religion=EXCLUDED.religion, 
-            height=EXCLUDED.height, geom=EXCLUDED.geom
-    """
-    
+    logger.info(f"Ingesting cells from {path.name}")
+
+    batches = map(_build_cell_records, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+
     async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-            
-            await conn.execute(
-                insert_sql,
-                str(uuid.uuid4()),                    # id (UUID)
-                world_id,                             # world_id (UUID)
-                int(p.get("id")),                     # cell_id (INTEGER)
-                int(p.get("biome", 0)),               # biome (INTEGER)
-                _safe_str(p.get("type")),             # type (TEXT)
-                int(p.get("population", 0)),          # population (INTEGER)
-                int(p.get("state", 0)),               # state (INTEGER)
-                int(p.get("culture", 0)),             # culture (INTEGER)
-                int(p.get("religion", 0)),            # religion (INTEGER)
-                int(p.get("height", 0)),              # height (INTEGER)
-                json.dumps(g),                        # geom (geometry)
-            )
-            rows += 1
-    
+        rows = await _copy_upsert(
+            conn, "public.maps_cells", "_cells_stage", _CELLS_STAGE_COLUMNS, batches,
+            _CELLS_MERGE_SQL, world_id,
+        )
+
     return rows
 
 
 async def ingest_burgs(path: Path, world_id: str) -> int:
     """Import burgs data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting burgs from {path.name} ({len(data.get('features', []))} features)")
-    
-    sql = """
-        INSERT INTO public.maps_burgs (id, world_id, burg_id, name, state, statefull, province, provincefull, 
-            culture, religion, population, populationraw, elevation, temperature, temperaturelikeness, 
-            capital, port, citadel, walls, plaza, temple, shanty, xworld, yworld, xpixel, ypixel, 
-            cell, emblem, geom) 
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, 
-            $20, $21, $22, $23, $24, $25, $26, $27, $28, ST_SetSRID(ST_GeomFromGeoJSON($29), 0))
-        ON CONFLICT (world_id, burg_id) DO UPDATE SET 
-            name=EXCLUDED.name, state=EXCLUDED.state, statefull=EXCLUDED.statefull,
-            province=EXCLUDED.province, provincefull=EXCLUDED.provincefull, culture=EXCLUDED.culture,
-            religion=EXCLUDED.religion, population=EXCLUDED.population, populationraw=EXCLUDED.populationraw,
-            elevation=EXCLUDED.elevation, temperature=EXCLUDED.temperature, 
-            temperaturelikeness=EXCLUDED.temperaturelikeness, capital=EXCLUDED.capital,
-            port=EXCLUDED.port, citadel=EXCLUDED.citadel, walls=EXCLUDED.walls, plaza=EXCLUDED.plaza,
-            temple=EXCLUDED.temple, shanty=EXCLUDED.shanty, xworld=EXCLUDED.xworld, yworld=EXCLUDED.yworld,
-            xpixel=EXCLUDED.xpixel, ypixel=EXCLUDED.ypixel, cell=EXCLUDED.cell, emblem=EXCLUDED.emblem,
-            geom=EXCLUDED.geom
-    """
-    
+    logger.info(f"Ingesting burgs from {path.name}")
+
+    batches = map(_build_burg_records, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+
     async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-            
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                           # id (UUID)
-                world_id,                                    # world_id (UUID)
-                int(p.get("id")),                            # burg_id (INTEGER)
-                _safe_str(p.get("name")),                    # name (TEXT)
-                _safe_str(p.get("state")),                   # state (TEXT)
-                _safe_str(p.get("stateFull")),               # statefull (TEXT)
-                _safe_str(p.get("province")),                # province (TEXT)
-                _safe_str(p.get("provinceFull")),            # provincefull (TEXT)
-                _safe_str(p.get("culture")),                 # culture (TEXT)
-                _safe_str(p.get("religion")),                # religion (TEXT)
-                int(p.get("population", 0)),                 # population (INTEGER)
-                float(p.get("populationRaw", 0.0)),          # populationraw (DOUBLE PRECISION)
-                int(p.get("elevation", 0)),                  # elevation (INTEGER)
-                _safe_str(p.get("temperature")),             # temperature (TEXT)
-                _safe_str(p.get("temperatureLikeness")),     # temperaturelikeness (TEXT)
-                bool(p.get("capital", False)),               # capital (BOOLEAN)
-                bool(p.get("port", False)),                  # port (BOOLEAN)
-                bool(p.get("citadel", False)),               # citadel (BOOLEAN)
-                bool(p.get("walls", False)),                 # walls (BOOLEAN)
-                bool(p.get("plaza", False)),                 # plaza (BOOLEAN)
-                bool(p.get("temple", False)),                # temple (BOOLEAN)
-                bool(p.get("shanty", False)),                # shanty (BOOLEAN)
-                int(p.get("xWorld", 0)),                     # xworld (INTEGER)
-                int(p.get("yWorld", 0)),                     # yworld (INTEGER)
-                float(p.get("xPixel", 0.0)),                 # xpixel (DOUBLE PRECISION)
-                float(p.get("yPixel", 0.0)),                 # ypixel (DOUBLE PRECISION)
-                int(p.get("cell", 0)),                       # cell (INTEGER)
-                json.dumps(p.get("emblem")) if p.get("emblem") is not None else None,  # emblem (JSONB)
-                json.dumps(g),                               # geom (geometry)
-            )
-            rows += 1
-    
+        rows = await _copy_upsert(
+            conn, "public.maps_burgs", "_burgs_stage", _BURGS_STAGE_COLUMNS, batches,
+            _BURGS_MERGE_SQL, world_id,
+        )
+
     return rows
 
 
 async def ingest_routes(path: Path, world_id: str) -> int:
     """Import routes data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting routes from {path.name} ({len(data.get('features', []))} features)")
-    
-    sql = """
-        INSERT INTO public.maps_routes (id, world_id, route_id, name, type, feature, geom) 
-        VALUES ($1, $2, $3, $4, $5, $6, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($7)), 0))
-        ON CONFLICT (world_id, route_id) DO UPDATE SET 
-            name=EXCLUDED.name, type=EXCLUDED.type, feature=EXCLUDED.feature, geom=EXCLUDED.geom
-    """
-    
+    logger.info(f"Ingesting routes from {path.name}")
+
+    batches = map(_build_route_records, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+
     async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-            
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                    # id (UUID)
-                world_id,                             # world_id (UUID)
-                int(p.get("id")),                     # route_id (INTEGER)
-                _safe_str(p.get("name")),             # name (TEXT)
-                _safe_str(p.get("type")),             # type (TEXT)
-                int(p.get("feature", 0)),             # feature (INTEGER)
-                json.dumps(g),                        # geom (geometry)
-            )
-            rows += 1
-    
+        rows = await _copy_upsert(
+            conn, "public.maps_routes", "_routes_stage", _ROUTES_STAGE_COLUMNS, batches,
+            _ROUTES_MERGE_SQL, world_id,
+        )
+
     return rows
 
 
 async def ingest_rivers(path: Path, world_id: str) -> int:
     """Import rivers data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting rivers from {path.name} ({len(data.get('features', []))} features)")
-    
-    sql = """
-        INSERT INTO public.maps_rivers (id, world_id, river_id, name, type, discharge, length, width, geom) 
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($9)), 0))
-        ON CONFLICT (world_id, river_id) DO UPDATE SET 
-            name=EXCLUDED.name, type=EXCLUDED.type, discharge=EXCLUDED.discharge,
-            length=EXCLUDED.length, width=EXCLUDED.width, geom=EXCLUDED.geom
-    """
-    
+    logger.info(f"Ingesting rivers from {path.name}")
+
+    batches = map(_build_river_records, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+
     async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-            
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                                                      # id (UUID)
-                world_id,                                                               # world_id (UUID)
-                int(p.get("id")),                                                       # river_id (INTEGER)
-                _safe_str(p.get("name")),                                               # name (TEXT)
-                _safe_str(p.get("type")),                                               # type (TEXT)
-                float(p.get("discharge", 0.0)) if p.get("discharge") is not None else None,  # discharge (DOUBLE PRECISION)
-                float(p.get("length", 0.0)) if p.get("length") is not None else None,        # length (DOUBLE PRECISION)
-                float(p.get("width", 0.0)) if p.get("width") is not None else None,          # width (DOUBLE PRECISION)
-                json.dumps(g),                                                          # geom (geometry)
-            )
-            rows += 1
-    
+        rows = await _copy_upsert(
+            conn, "public.maps_rivers", "_rivers_stage", _RIVERS_STAGE_COLUMNS, batches,
+            _RIVERS_MERGE_SQL, world_id,
+        )
+
     return rows
 
 
 async def ingest_markers(path: Path, world_id: str) -> int:
     """Import markers data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting markers from {path.name} ({len(data.get('features', []))} features)")
-    
-    sql = """
-        INSERT INTO public.maps_markers (id, world_id, marker_id, type, icon, x_px, y_px, note, geom) 
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, ST_SetSRID(ST_GeomFromGeoJSON($9), 0))
-        ON CONFLICT (world_id, marker_id) DO UPDATE SET 
-            type=EXCLUDED.type, icon=EXCLUDED.icon, x_px=EXCLUDED.x_px, y_px=EXCLUDED.y_px,
-            note=EXCLUDED.note, geom=EXCLUDED.geom
-    """
-    
+    logger.info(f"Ingesting markers from {path.name}")
+
+    batches = map(_build_marker_records, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+
     async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-            
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                                                    # id (UUID)
-                world_id,                                                             # world_id (UUID)
-                int(p.get("id")),                                                     # marker_id (INTEGER)
-                _safe_str(p.get("type")),                                             # type (TEXT)
-                _safe_str(p.get("icon")),                                             # icon (TEXT)
-                float(p.get("x_px", 0.0)) if p.get("x_px") is not None else None,    # x_px (DOUBLE PRECISION)
-                float(p.get("y_px", 0.0)) if p.get("y_px") is not None else None,    # y_px (DOUBLE PRECISION)
-                _safe_str(p.get("note")),                                             # note (TEXT)
-                json.dumps(g),                                                        # geom (geometry)
-            )
-            rows += 1
-    
+        rows = await _copy_upsert(
+            conn, "public.maps_markers", "_markers_stage", _MARKERS_STAGE_COLUMNS, batches,
+            _MARKERS_MERGE_SQL, world_id,
+        )
+
     return rows
 
 
+# Importers per world file type; each runs concurrently on its own pooled connection
+_INGEST_FUNCTIONS = {
+    'cells': ingest_cells,
+    'burgs': ingest_burgs,
+    'routes': ingest_routes,
+    'rivers': ingest_rivers,
+    'markers': ingest_markers,
+}
+
+
 def find_world_files(world_name: str, search_dir: Path = None) -> Dict[str, Path]:
     """Find all GeoJSON files for a given world name"""
     if search_dir is None:
@@ -591,35 +1026,41 @@ async def import_world(world_name: str, search_dir: Path = None) -> None:
     map_metadata, metadata_path = _build_map_metadata(world_name, world_files)
     logger.info(
         "Using canonical map metadata: %spx x %spx @ %sm/px",
-        map_metadata.get('width_pixels'),
-        map_metadata.get('height_pixels'),
-        map_metadata.get('meters_per_pixel'),
+        map_metadata.width_pixels,
+        map_metadata.height_pixels,
+        map_metadata.meters_per_pixel,
     )
     _write_metadata_file(map_metadata, metadata_path)
 
     # Create world entry in the database using the shared metadata
     world_id = await create_world_entry(world_name, map_metadata)
     
-    # Import each file type
-    import_functions = {
-        'cells': ingest_cells,
-        'burgs': ingest_burgs,
-        'routes': ingest_routes,
-        'rivers': ingest_rivers,
-        'markers': ingest_markers,
-    }
-    
-    total_rows = 0
-    for file_type, file_path in world_files.items():
-        if file_type in import_functions:
-            try:
-                rows = await import_functions[file_type](file_path, world_id)
-                total_rows += rows
-                logger.info(f"Imported {rows} {file_type} features")
-            except Exception as e:
-                logger.error(f"Failed to import {file_type}: {e}")
-                raise
-    
+    async def run_import(file_type: str, file_path: Path) -> int:
+        try:
+            rows = await _INGEST_FUNCTIONS[file_type](file_path, world_id)
+        except Exception as e:
+            logger.error(f"Failed to import {file_type}: {e}")
+            raise
+        logger.info(f"Imported {rows} {file_type} features")
+        return rows
+
+    # Each ingest acquires its own pooled connection, so the tables load concurrently;
+    # the first failure cancels the rest, rolling back their transactions
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(run_import(file_type, file_path))
+                for file_type, file_path in world_files.items()
+                if file_type in _INGEST_FUNCTIONS
+            ]
+    except ExceptionGroup as errors:
+        # Each failure was already logged by run_import; surface the first one to main()
+        raise errors.exceptions[0]
+    finally:
+        # Parsed files can be hundreds of MB; don't hold them past this world
+        _load_geojson.cache_clear()
+    total_rows = sum(task.result() for task in tasks)
+
     logger.info(f"Successfully imported world '{world_name}' with {total_rows} total features")
 
 
@@ -644,6 +1085,12 @@ async def main():
         default="postgresql://localhost/questables",
         help="PostgreSQL database URL"
     )
+    parser.add_argument(
+        "--fast-import",
+        action="store_true",
+        help="Skip synchronous commits "
+             "(a crash right after an ingest commits may lose it; re-run the import)"
+    )
     
     args = parser.parse_args()
     
@@ -652,7 +1099,12 @@ async def main():
     db_manager = DatabaseManager(args.database_url)
     
     try:
-        await db_manager.connect()
+        # One connection per concurrent ingest, plus headroom for the world entry
+        await db_manager.connect(
+            min_size=len(_INGEST_FUNCTIONS),
+            max_size=len(_INGEST_FUNCTIONS) + 2,
+            server_settings={'synchronous_commit': 'off'} if args.fast_import else None,
+        )
         await import_world(args.world, args.dir)
     except Exception as e:
         logger.error(f"Import failed: {e}")
@@ -662,5 +1114,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional, the default asyncio loop is used when unavailable
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
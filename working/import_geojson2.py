@@ -7,15 +7,33 @@ Usage: python import_geojson.py --world <world_name>
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
+import struct
 import sys
+from array import array
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import AsyncIterator, Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
 import uuid
 
 import asyncpg
 
+try:
+    import ijson
+except ImportError:  # optional, features are read with a full parse when unavailable
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used when unavailable
+    orjson = None
+
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -26,9 +44,19 @@ class DatabaseManager:
         self.database_url = database_url
         self._connection_pool = None
 
-    async def connect(self):
+    async def connect(
+        self,
+        min_size: int = 10,
+        max_size: int = 10,
+        server_settings: Optional[Dict[str, str]] = None,
+    ):
         """Initialize connection pool"""
-        self._connection_pool = await asyncpg.create_pool(self.database_url)
+        self._connection_pool = await asyncpg.create_pool(
+            self.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            server_settings=server_settings,
+        )
         logger.info("Database connection pool established")
 
     async def close(self):
@@ -37,20 +65,55 @@ class DatabaseManager:
             await self._connection_pool.close()
             logger.info("Database connection pool closed")
 
-    def transaction(self):
-        """Get a database transaction context"""
+    def connection(self):
+        """Get a pooled connection context (statements autocommit)"""
         return self._connection_pool.acquire()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Get a pooled connection with a transaction open for the duration of the context"""
+        async with self._connection_pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
 
 # Global database manager instance
 db_manager = DatabaseManager("postgresql://localhost/questables")
 
+# WKB is written in native byte order so coordinate arrays can be dumped directly
+_WKB_BYTE_ORDER = b'\x01' if sys.byteorder == 'little' else b'\x00'
+_WKB_UINT32 = struct.Struct('=I').pack
+# Rows converted and sent per COPY so memory stays bounded when features are streamed
+_COPY_BATCH_SIZE = 5000
+_WKB_TYPES = {
+    'Point': 1,
+    'LineString': 2,
+    'Polygon': 3,
+    'MultiPoint': 4,
+    'MultiLineString': 5,
+    'MultiPolygon': 6,
+}
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to compact JSON text, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
 
 def _read_geojson(path: Path) -> Dict[str, Any]:
     """Read and parse a GeoJSON file"""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
         logger.debug(f"Successfully read {path.name}")
         return data
     except Exception as e:
@@ -58,52 +121,177 @@ def _read_geojson(path: Path) -> Dict[str, Any]:
         raise
 
 
+def _iter_features(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield GeoJSON features one at a time, streaming the file with ijson when available"""
+    if ijson is None:
+        yield from _read_geojson(path).get('features', [])
+        return
+
+    try:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'features.item', use_float=True)
+    except Exception as e:
+        logger.error(f"Failed to read {path}: {e}")
+        raise
+
+
+def _wkb_coords(points: List[List[float]]) -> bytes:
+    """Encode a point count followed by packed x/y doubles"""
+    coords = array('d', chain.from_iterable(points))
+    if len(coords) != 2 * len(points):
+        # Drop Z/M ordinates; the map tables store 2D geometries
+        coords = array('d', chain.from_iterable(point[:2] for point in points))
+    return _WKB_UINT32(len(points)) + coords.tobytes()
+
+
+def _write_wkb(geom_type: str, coordinates: Any, out: List[bytes]) -> None:
+    """Append the WKB encoding of a GeoJSON type/coordinates pair to out"""
+    try:
+        out.append(_WKB_BYTE_ORDER + _WKB_UINT32(_WKB_TYPES[geom_type]))
+    except KeyError:
+        raise ValueError(f"Unsupported geometry type: {geom_type}") from None
+
+    if geom_type == 'Point':
+        out.append(array('d', coordinates[:2]).tobytes())
+    elif geom_type == 'LineString':
+        out.append(_wkb_coords(coordinates))
+    elif geom_type == 'Polygon':
+        out.append(_WKB_UINT32(len(coordinates)))
+        out.extend(_wkb_coords(ring) for ring in coordinates)
+    else:
+        part_type = geom_type[len('Multi'):]
+        out.append(_WKB_UINT32(len(coordinates)))
+        for part in coordinates:
+            _write_wkb(part_type, part, out)
+
+
+def _geojson_to_wkb(geometry: Optional[Dict[str, Any]], as_multi: bool = False) -> Optional[bytes]:
+    """Convert a GeoJSON geometry dict to WKB so PostGIS can skip JSON parsing"""
+    if geometry is None:
+        return None
+    geom_type = geometry['type']
+    coordinates = geometry['coordinates']
+    if as_multi and not geom_type.startswith('Multi'):
+        # Wrap single parts here so the Multi* columns need no ST_Multi on the server
+        geom_type, coordinates = f"Multi{geom_type}", [coordinates]
+    out: List[bytes] = []
+    _write_wkb(geom_type, coordinates, out)
+    return b''.join(out)
+
+
+def _uuid4_batch(count: int) -> List[uuid.UUID]:
+    """Generate random (version 4) UUIDs from a single urandom read"""
+    # asyncpg binds uuid.UUID directly, so no string formatting is needed
+    raw = os.urandom(16 * count)
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
+def _record_builder(
+    fields: Tuple[Tuple[str, Any, Callable[[Any], Any]], ...],
+    as_multi: bool = False,
+) -> Callable[[List[Dict[str, Any]]], List[Tuple[Any, ...]]]:
+    """Build a function turning a batch of features into staging records (id, *fields, geom)"""
+    keys = tuple(key for key, _, _ in fields)
+    defaults = tuple(default for _, default, _ in fields)
+    casts = tuple(cast for _, _, cast in fields)
+    getter = itemgetter(*keys)
+
+    def extract(properties: Dict[str, Any]) -> Tuple[Any, ...]:
+        try:
+            return getter(properties)
+        except KeyError:
+            # Some optional properties are absent, fall back to per-key defaults
+            return tuple(map(properties.get, keys, defaults))
+
+    def build(features: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        values = [extract(f.get("properties") or _EMPTY_PROPERTIES) for f in features]
+        # Coerce column-wise so each cast runs as one C-level map over the batch
+        columns = [map(cast, column) for cast, column in zip(casts, zip(*values))]
+        ids = _uuid4_batch(len(features))
+        geoms = [_geojson_to_wkb(f.get("geometry"), as_multi) for f in features]
+        return list(zip(ids, *columns, geoms))
+
+    return build
+
+
+# Shared stand-in for features without properties; only ever read
+_EMPTY_PROPERTIES: Dict[str, Any] = {}
+
+
 def _safe_str(value: Any) -> Optional[str]:
     """Safely convert value to string, handling None and encoding issues"""
     if value is None:
         return None
     try:
-        # Convert to string and handle unicode surrogates
-        text = str(value)
-        # Remove or replace problematic unicode surrogates
-        text = text.encode('utf-8', 'ignore').decode('utf-8')
-        return text
+        # Convert to string (str values pass through)
+        text = value if type(value) is str else str(value)
     except Exception:
         return None
+    # ASCII text can't hold surrogates, which covers most names and types in Azgaar exports
+    if text.isascii():
+        return text
+    # Remove or replace problematic unicode surrogates
+    return text.encode('utf-8', 'ignore').decode('utf-8')
+
+
+def _opt_float(value: Any) -> Optional[float]:
+    """Convert to float, keeping None as NULL"""
+    return None if value is None else float(value)
+
+
+def _opt_json(value: Any) -> Optional[str]:
+    """Serialize to JSON text, keeping None as NULL"""
+    return None if value is None else _json_dumps(value)
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
-def _calculate_bounds(all_features: List[Dict[str, Any]]) -> Dict[str, float]:
+# Flatten a geometry's coordinates into a list of positions, dispatched once per feature on its type
+_GEOMETRY_POSITIONS: Dict[str, Callable[[Any], List[Any]]] = {
+    'Point': lambda coords: [coords],
+    'LineString': lambda coords: coords,
+    'MultiLineString': lambda coords: list(chain.from_iterable(coords)),
+    'Polygon': lambda coords: list(chain.from_iterable(coords)),
+    'MultiPolygon': lambda coords: list(chain.from_iterable(chain.from_iterable(coords))),
+}
+
+
+def _merge_bounds(parts: Iterable[Dict[str, float]]) -> Dict[str, float]:
+    """Combine partial bounding boxes into one"""
+    parts = list(parts)
+    return {
+        "north": max((b["north"] for b in parts), default=float('-inf')),
+        "south": min((b["south"] for b in parts), default=float('inf')),
+        "east": max((b["east"] for b in parts), default=float('-inf')),
+        "west": min((b["west"] for b in parts), default=float('inf'))
+    }
+
+
+def _calculate_bounds(all_features: Iterable[Dict[str, Any]]) -> Dict[str, float]:
     """Calculate bounding box from all map features"""
     min_lat = min_lng = float('inf')
     max_lat = max_lng = float('-inf')
 
     for feature in all_features:
         geom = feature.get('geometry', {})
-        coords = geom.get('coordinates', [])
-
-        if geom.get('type') == 'Point':
-            lng, lat = coords
-            min_lng, max_lng = min(min_lng, lng), max(max_lng, lng)
-            min_lat, max_lat = min(min_lat, lat), max(max_lat, lat)
-        elif geom.get('type') in ['LineString', 'MultiLineString']:
-            # Handle line geometries
-            if geom.get('type') == 'LineString':
-                coords = [coords]
-            for line in coords:
-                for point in line:
-                    lng, lat = point[:2]  # Handle 2D/3D coordinates
-                    min_lng, max_lng = min(min_lng, lng), max(max_lng, lng)
-                    min_lat, max_lat = min(min_lat, lat), max(max_lat, lat)
-        elif geom.get('type') in ['Polygon', 'MultiPolygon']:
-            # Handle polygon geometries
-            if geom.get('type') == 'Polygon':
-                coords = [coords]
-            for polygon in coords:
-                for ring in polygon:
-                    for point in ring:
-                        lng, lat = point[:2]  # Handle 2D/3D coordinates
-                        min_lng, max_lng = min(min_lng, lng), max(max_lng, lng)
-                        min_lat, max_lat = min(min_lat, lat), max(max_lat, lat)
+        positions = _GEOMETRY_POSITIONS.get(geom.get('type'))
+        if positions is None:
+            continue
+        points = positions(geom.get('coordinates', []))
+        if not points:
+            continue
+
+        # Reduce each axis with the builtin min/max in one C-level pass per geometry
+        # instead of four comparisons per vertex (handles 2D/3D coordinates)
+        lngs = [point[0] for point in points]
+        lats = [point[1] for point in points]
+        min_lng, max_lng = min(min_lng, min(lngs)), max(max_lng, max(lngs))
+        min_lat, max_lat = min(min_lat, min(lats)), max(max_lat, max(lats))
 
     return {
         "north": max_lat,
@@ -113,260 +301,240 @@ def _calculate_bounds(all_features: List[Dict[str, Any]]) -> Dict[str, float]:
     }
 
 
-async def create_world_entry(world_name: str, all_features: List[Dict[str, Any]]) -> str:
-    """Create a new maps_world entry and return its UUID"""
-    bounds = _calculate_bounds(all_features)
-
-    # First try to find existing world
-    select_sql = "SELECT id FROM public.maps_world WHERE name = $1"
+async def _copy_upsert(
+    conn: asyncpg.Connection,
+    target_table: str,
+    stage_table: str,
+    stage_columns: List[Tuple[str, str]],
+    batches: Iterable[List[Tuple[Any, ...]]],
+    merge_sql: str,
+    world_id: str,
+) -> int:
+    """Bulk-load record batches into a temp staging table via COPY, then merge into the target table
 
-    async with db_manager.transaction() as conn:
-        existing = await conn.fetchrow(select_sql, world_name)
-
-        if existing:
-            world_id = str(existing['id'])
-            # Update existing world
-            update_sql = """
-                UPDATE public.maps_world
-                SET description = $2, bounds = $3, updated_at = NOW()
-                WHERE id = $1
-            """
-            await conn.execute(
-                update_sql,
-                world_id,
-                f"Imported world map: {world_name}",
-                json.dumps(bounds)
-            )
-            logger.info(f"Updated existing world '{world_name}' with ID: {world_id}")
-        else:
-            # Create new world
-            world_id = str(uuid.uuid4())
-            insert_sql = """
-                INSERT INTO public.maps_world (id, name, description, bounds, is_active)
-                VALUES ($1, $2, $3, $4, $5)
-            """
-            await conn.execute(
-                insert_sql,
-                world_id,
-                world_name,
-                f"Imported world map: {world_name}",
-                json.dumps(bounds),
-                True
-            )
-            logger.info(f"Created new world '{world_name}' with ID: {world_id}")
-
-        return world_id
-
-
-async def ingest_cells(path: Path, world_id: str) -> int:
-    """Import cells data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting cells from {path.name} ({len(data.get('features', []))} features)")
-
-    insert_sql = """
-        INSERT INTO public.maps_cells (id, world_id, cell_id, biome, type, population, state, culture, religion, height, geom)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($11)), 0))
-        ON CONFLICT (world_id, cell_id) DO UPDATE SET
-            biome=EXCLUDED.biome, type=EXCLUDED.type, population=EXCLUDED.population,
-            state=EXCLUDED.state, culture=EXCLUDED.culture, religion=EXCLUDED.religion,
-            height=EXCLUDED.height, geom=EXCLUDED.geom
+    Must run inside the import transaction; the staging table is dropped when it commits.
     """
-
-    async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-
-            await conn.execute(
-                insert_sql,
-                str(uuid.uuid4()),                    # id (UUID)
-                world_id,                             # world_id (UUID)
-                int(p.get("id")),                     # cell_id (INTEGER)
-                int(p.get("biome", 0)),               # biome (INTEGER)
-                _safe_str(p.get("type")),             # type (TEXT)
-                int(p.get("population", 0)),          # population (INTEGER)
-                int(p.get("state", 0)),               # state (INTEGER)
-                int(p.get("culture", 0)),             # culture (INTEGER)
-                int(p.get("religion", 0)),            # religion (INTEGER)
-                int(p.get("height", 0)),              # height (INTEGER)
-                json.dumps(g),                        # geom (geometry)
-            )
-            rows += 1
-
-    return rows
-
-
-async def ingest_burgs(path: Path, world_id: str) -> int:
-    """Import burgs data aligned with database schema"""
-    data = _read_geojson(path)
+    column_ddl = ", ".join(f"{name} {pg_type}" for name, pg_type in stage_columns)
+    columns = [name for name, _ in stage_columns]
     rows = 0
-    logger.info(f"Ingesting burgs from {path.name} ({len(data.get('features', []))} features)")
-
-    sql = """
-        INSERT INTO public.maps_burgs (id, world_id, burg_id, name, state, statefull, province, provincefull,
-            culture, religion, population, populationraw, elevation, temperature, temperaturelikeness,
-            capital, port, citadel, walls, plaza, temple, shanty, xworld, yworld, xpixel, ypixel,
-            cell, emblem, geom)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19,
-            $20, $21, $22, $23, $24, $25, $26, $27, $28, ST_SetSRID(ST_GeomFromGeoJSON($29), 0))
-        ON CONFLICT (world_id, burg_id) DO UPDATE SET
-            name=EXCLUDED.name, state=EXCLUDED.state, statefull=EXCLUDED.statefull,
-            province=EXCLUDED.province, provincefull=EXCLUDED.provincefull, culture=EXCLUDED.culture,
-            religion=EXCLUDED.religion, population=EXCLUDED.population, populationraw=EXCLUDED.populationraw,
-            elevation=EXCLUDED.elevation, temperature=EXCLUDED.temperature,
-            temperaturelikeness=EXCLUDED.temperaturelikeness, capital=EXCLUDED.capital,
-            port=EXCLUDED.port, citadel=EXCLUDED.citadel, walls=EXCLUDED.walls, plaza=EXCLUDED.plaza,
-            temple=EXCLUDED.temple, shanty=EXCLUDED.shanty, xworld=EXCLUDED.xworld, yworld=EXCLUDED.yworld,
-            xpixel=EXCLUDED.xpixel, ypixel=EXCLUDED.ypixel, cell=EXCLUDED.cell, emblem=EXCLUDED.emblem,
-            geom=EXCLUDED.geom
-    """
-
-    async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                           # id (UUID)
-                world_id,                                    # world_id (UUID)
-                int(p.get("id")),                            # burg_id (INTEGER)
-                _safe_str(p.get("name")),                    # name (TEXT)
-                _safe_str(p.get("state")),                   # state (TEXT)
-                _safe_str(p.get("stateFull")),               # statefull (TEXT)
-                _safe_str(p.get("province")),                # province (TEXT)
-                _safe_str(p.get("provinceFull")),            # provincefull (TEXT)
-                _safe_str(p.get("culture")),                 # culture (TEXT)
-                _safe_str(p.get("religion")),                # religion (TEXT)
-                int(p.get("population", 0)),                 # population (INTEGER)
-                float(p.get("populationRaw", 0.0)),          # populationraw (DOUBLE PRECISION)
-                int(p.get("elevation", 0)),                  # elevation (INTEGER)
-                _safe_str(p.get("temperature")),             # temperature (TEXT)
-                _safe_str(p.get("temperatureLikeness")),     # temperaturelikeness (TEXT)
-                bool(p.get("capital", False)),               # capital (BOOLEAN)
-                bool(p.get("port", False)),                  # port (BOOLEAN)
-                bool(p.get("citadel", False)),               # citadel (BOOLEAN)
-                bool(p.get("walls", False)),                 # walls (BOOLEAN)
-                bool(p.get("plaza", False)),                 # plaza (BOOLEAN)
-                bool(p.get("temple", False)),                # temple (BOOLEAN)
-                bool(p.get("shanty", False)),                # shanty (BOOLEAN)
-                int(p.get("xWorld", 0)),                     # xworld (INTEGER)
-                int(p.get("yWorld", 0)),                     # yworld (INTEGER)
-                float(p.get("xPixel", 0.0)),                 # xpixel (DOUBLE PRECISION)
-                float(p.get("yPixel", 0.0)),                 # ypixel (DOUBLE PRECISION)
-                int(p.get("cell", 0)),                       # cell (INTEGER)
-                json.dumps(p.get("emblem")) if p.get("emblem") is not None else None,  # emblem (JSONB)
-                json.dumps(g),                               # geom (geometry)
-            )
-            rows += 1
 
+    async def records() -> AsyncIterator[Tuple[Any, ...]]:
+        nonlocal rows
+        for batch in batches:
+            rows += len(batch)
+            for record in batch:
+                yield record
+
+    # ordinal numbers the rows in COPY order, so merges can keep the last row per feature id
+    await conn.execute(
+        f"CREATE TEMP TABLE {stage_table} ({column_ddl}, ordinal bigint GENERATED ALWAYS AS IDENTITY) "
+        "ON COMMIT DROP"
+    )
+    # A single COPY pulls batches as they are built, so only the current one is held in memory
+    await conn.copy_records_to_table(stage_table, records=records(), columns=columns)
+    rebuild_sql = await _drop_secondary_indexes(conn, target_table)
+    await conn.execute(merge_sql, world_id)
+    for index_sql in rebuild_sql:
+        await conn.execute(index_sql)
     return rows
 
 
-async def ingest_routes(path: Path, world_id: str) -> int:
-    """Import routes data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting routes from {path.name} ({len(data.get('features', []))} features)")
-
-    sql = """
-        INSERT INTO public.maps_routes (id, world_id, route_id, name, type, feature, geom)
-        VALUES ($1, $2, $3, $4, $5, $6, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($7)), 0))
-        ON CONFLICT (world_id, route_id) DO UPDATE SET
-            name=EXCLUDED.name, type=EXCLUDED.type, feature=EXCLUDED.feature, geom=EXCLUDED.geom
-    """
-
-    async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                    # id (UUID)
-                world_id,                             # world_id (UUID)
-                int(p.get("id")),                     # route_id (INTEGER)
-                _safe_str(p.get("name")),             # name (TEXT)
-                _safe_str(p.get("type")),             # type (TEXT)
-                int(p.get("feature", 0)),             # feature (INTEGER)
-                json.dumps(g),                        # geom (geometry)
-            )
-            rows += 1
+async def _drop_secondary_indexes(conn: asyncpg.Connection, table: str) -> List[str]:
+    """Drop the non-unique, non-constraint indexes of an empty table, returning the SQL to recreate them"""
+    # Only a first import into an empty table builds its indexes once after loading;
+    # tables that already hold other worlds keep their indexes online
+    if await conn.fetchval(f"SELECT EXISTS (SELECT 1 FROM {table})"):
+        return []
+
+    indexes = await conn.fetch(
+        """
+        SELECT i.indexrelid::regclass::text AS name, pg_get_indexdef(i.indexrelid) AS definition
+        FROM pg_index i
+        WHERE i.indrelid = $1::regclass
+          AND NOT i.indisprimary
+          AND NOT i.indisunique
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """,
+        table,
+    )
+    for index in indexes:
+        await conn.execute(f"DROP INDEX {index['name']}")
+    return [index['definition'] for index in indexes]
 
-    return rows
 
+async def create_world_entry(conn: asyncpg.Connection, world_name: str) -> str:
+    """Create a new maps_world entry and return its UUID (bounds are set after ingest)"""
+    # First try to find existing world
+    select_sql = "SELECT id FROM public.maps_world WHERE name = $1"
 
-async def ingest_rivers(path: Path, world_id: str) -> int:
-    """Import rivers data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting rivers from {path.name} ({len(data.get('features', []))} features)")
-
-    sql = """
-        INSERT INTO public.maps_rivers (id, world_id, river_id, name, type, discharge, length, width, geom)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON($9)), 0))
-        ON CONFLICT (world_id, river_id) DO UPDATE SET
-            name=EXCLUDED.name, type=EXCLUDED.type, discharge=EXCLUDED.discharge,
-            length=EXCLUDED.length, width=EXCLUDED.width, geom=EXCLUDED.geom
+    existing = await conn.fetchrow(select_sql, world_name)
+
+    if existing:
+        world_id = str(existing['id'])
+        # Update existing world
+        update_sql = """
+            UPDATE public.maps_world
+            SET description = $2, updated_at = NOW()
+            WHERE id = $1
+        """
+        await conn.execute(
+            update_sql,
+            world_id,
+            f"Imported world map: {world_name}"
+        )
+        logger.info(f"Updated existing world '{world_name}' with ID: {world_id}")
+    else:
+        # Create new world
+        world_id = str(uuid.uuid4())
+        insert_sql = """
+            INSERT INTO public.maps_world (id, name, description, bounds, is_active)
+            VALUES ($1, $2, $3, $4, $5)
+        """
+        await conn.execute(
+            insert_sql,
+            world_id,
+            world_name,
+            f"Imported world map: {world_name}",
+            _json_dumps({}),  # bounds (filled in by update_world_bounds)
+            True
+        )
+        logger.info(f"Created new world '{world_name}' with ID: {world_id}")
+
+    return world_id
+
+
+async def update_world_bounds(conn: asyncpg.Connection, world_id: str, bounds: Dict[str, float]) -> None:
+    """Store the bounding box gathered while ingesting the world's features"""
+    update_sql = """
+        UPDATE public.maps_world
+        SET bounds = $2, updated_at = NOW()
+        WHERE id = $1
     """
+    await conn.execute(update_sql, world_id, _json_dumps(bounds))
 
-    async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                                                      # id (UUID)
-                world_id,                                                               # world_id (UUID)
-                int(p.get("id")),                                                       # river_id (INTEGER)
-                _safe_str(p.get("name")),                                               # name (TEXT)
-                _safe_str(p.get("type")),                                               # type (TEXT)
-                float(p.get("discharge", 0.0)) if p.get("discharge") is not None else None,  # discharge (DOUBLE PRECISION)
-                float(p.get("length", 0.0)) if p.get("length") is not None else None,        # length (DOUBLE PRECISION)
-                float(p.get("width", 0.0)) if p.get("width") is not None else None,          # width (DOUBLE PRECISION)
-                json.dumps(g),                                                          # geom (geometry)
-            )
-            rows += 1
-
-    return rows
 
+@dataclass(frozen=True)
+class TableDesc:
+    """How one world file type maps onto its target table
 
-async def ingest_markers(path: Path, world_id: str) -> int:
-    """Import markers data aligned with database schema"""
-    data = _read_geojson(path)
-    rows = 0
-    logger.info(f"Ingesting markers from {path.name} ({len(data.get('features', []))} features)")
-
-    sql = """
-        INSERT INTO public.maps_markers (id, world_id, marker_id, type, icon, x_px, y_px, note, geom)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, ST_SetSRID(ST_GeomFromGeoJSON($9), 0))
-        ON CONFLICT (world_id, marker_id) DO UPDATE SET
-            type=EXCLUDED.type, icon=EXCLUDED.icon, x_px=EXCLUDED.x_px, y_px=EXCLUDED.y_px,
-            note=EXCLUDED.note, geom=EXCLUDED.geom
+    Each column is (column, pg_type, source property, default when absent, cast). The first
+    column is the per-world feature id that the ON CONFLICT merge keys on; when a file
+    repeats an id, the last occurrence wins.
+    """
+    table: str
+    columns: Tuple[Tuple[str, str, str, Any, Callable[[Any], Any]], ...]
+    as_multi: bool = False  # promote single geometries to their Multi* type
+
+    @property
+    def stage_columns(self) -> List[Tuple[str, str]]:
+        return [("id", "uuid")] + [(name, pg_type) for name, pg_type, *_ in self.columns] + [("geom_wkb", "bytea")]
+
+    def merge_sql(self, stage_table: str) -> str:
+        names = [name for name, *_ in self.columns]
+        updates = [f"{name}=EXCLUDED.{name}" for name in names[1:]] + ["geom=EXCLUDED.geom"]
+        return f"""
+        INSERT INTO public.{self.table} (id, world_id, {", ".join(names)}, geom)
+        SELECT DISTINCT ON ({names[0]}) id, $1::uuid, {", ".join(names)}, ST_GeomFromWKB(geom_wkb, 0)
+        FROM {stage_table}
+        ORDER BY {names[0]}, ordinal DESC
+        ON CONFLICT (world_id, {names[0]}) DO UPDATE SET
+            {", ".join(updates)}
     """
 
-    async with db_manager.transaction() as conn:
-        for f in data.get("features", []):
-            p = f.get("properties", {})
-            g = f.get("geometry")
-
-            await conn.execute(
-                sql,
-                str(uuid.uuid4()),                                                    # id (UUID)
-                world_id,                                                             # world_id (UUID)
-                int(p.get("id")),                                                     # marker_id (INTEGER)
-                _safe_str(p.get("type")),                                             # type (TEXT)
-                _safe_str(p.get("icon")),                                             # icon (TEXT)
-                float(p.get("x_px", 0.0)) if p.get("x_px") is not None else None,    # x_px (DOUBLE PRECISION)
-                float(p.get("y_px", 0.0)) if p.get("y_px") is not None else None,    # y_px (DOUBLE PRECISION)
-                _safe_str(p.get("note")),                                             # note (TEXT)
-                json.dumps(g),                                                        # geom (geometry)
-            )
-            rows += 1
 
-    return rows
+# Table layout per world file type; they are imported in this order on the shared import connection
+_TABLES: Dict[str, TableDesc] = {
+    'cells': TableDesc('maps_cells', (
+        ("cell_id", "integer", "id", None, int),
+        ("biome", "integer", "biome", 0, int),
+        ("type", "text", "type", None, _safe_str),
+        ("population", "integer", "population", 0, int),
+        ("state", "integer", "state", 0, int),
+        ("culture", "integer", "culture", 0, int),
+        ("religion", "integer", "religion", 0, int),
+        ("height", "integer", "height", 0, int),
+    ), as_multi=True),
+    'burgs': TableDesc('maps_burgs', (
+        ("burg_id", "integer", "id", None, int),
+        ("name", "text", "name", None, _safe_str),
+        ("state", "text", "state", None, _safe_str),
+        ("statefull", "text", "stateFull", None, _safe_str),
+        ("province", "text", "province", None, _safe_str),
+        ("provincefull", "text", "provinceFull", None, _safe_str),
+        ("culture", "text", "culture", None, _safe_str),
+        ("religion", "text", "religion", None, _safe_str),
+        ("population", "integer", "population", 0, int),
+        ("populationraw", "double precision", "populationRaw", 0.0, float),
+        ("elevation", "integer", "elevation", 0, int),
+        ("temperature", "text", "temperature", None, _safe_str),
+        ("temperaturelikeness", "text", "temperatureLikeness", None, _safe_str),
+        ("capital", "boolean", "capital", False, bool),
+        ("port", "boolean", "port", False, bool),
+        ("citadel", "boolean", "citadel", False, bool),
+        ("walls", "boolean", "walls", False, bool),
+        ("plaza", "boolean", "plaza", False, bool),
+        ("temple", "boolean", "temple", False, bool),
+        ("shanty", "boolean", "shanty", False, bool),
+        ("xworld", "integer", "xWorld", 0, int),
+        ("yworld", "integer", "yWorld", 0, int),
+        ("xpixel", "double precision", "xPixel", 0.0, float),
+        ("ypixel", "double precision", "yPixel", 0.0, float),
+        ("cell", "integer", "cell", 0, int),
+        ("emblem", "jsonb", "emblem", None, _opt_json),
+    )),
+    'routes': TableDesc('maps_routes', (
+        ("route_id", "integer", "id", None, int),
+        ("name", "text", "name", None, _safe_str),
+        ("type", "text", "type", None, _safe_str),
+        ("feature", "integer", "feature", 0, int),
+    ), as_multi=True),
+    'rivers': TableDesc('maps_rivers', (
+        ("river_id", "integer", "id", None, int),
+        ("name", "text", "name", None, _safe_str),
+        ("type", "text", "type", None, _safe_str),
+        ("discharge", "double precision", "discharge", None, _opt_float),
+        ("length", "double precision", "length", None, _opt_float),
+        ("width", "double precision", "width", None, _opt_float),
+    ), as_multi=True),
+    'markers': TableDesc('maps_markers', (
+        ("marker_id", "integer", "id", None, int),
+        ("type", "text", "type", None, _safe_str),
+        ("icon", "text", "icon", None, _safe_str),
+        ("x_px", "double precision", "x_px", None, _opt_float),
+        ("y_px", "double precision", "y_px", None, _opt_float),
+        ("note", "text", "note", None, _safe_str),
+    )),
+}
+
+# Record builders per file type, so each table's itemgetter is made once rather than per batch
+_RECORD_BUILDERS = {
+    file_type: _record_builder(tuple(column[2:] for column in desc.columns), desc.as_multi)
+    for file_type, desc in _TABLES.items()
+}
+
+
+async def ingest(
+    conn: asyncpg.Connection, file_type: str, path: Path, world_id: str
+) -> Tuple[int, Dict[str, float]]:
+    """Import one world file into its table as described in _TABLES"""
+    logger.info(f"Ingesting {file_type} from {path.name}")
+
+    desc = _TABLES[file_type]
+    stage_table = f"_{file_type}_stage"
+    build_records = _RECORD_BUILDERS[file_type]
+    batch_bounds = []
+
+    def build(features: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        batch_bounds.append(_calculate_bounds(features))
+        return build_records(features)
+
+    batches = map(build, _batched(_iter_features(path), _COPY_BATCH_SIZE))
+    rows = await _copy_upsert(
+        conn, f"public.{desc.table}", stage_table, desc.stage_columns, batches,
+        desc.merge_sql(stage_table), world_id,
+    )
+
+    return rows, _merge_bounds(batch_bounds)
 
 
 def find_world_files(world_name: str, search_dir: Path = None) -> Dict[str, Path]:
@@ -408,34 +576,31 @@ async def import_world(world_name: str, search_dir: Path = None) -> None:
         logger.error(f"No GeoJSON files found for world '{world_name}'")
         return
 
-    # Collect all features for bounds calculation
-    all_features = []
-    for file_path in world_files.values():
-        data = _read_geojson(file_path)
-        all_features.extend(data.get('features', []))
-
-    # Create world entry
-    world_id = await create_world_entry(world_name, all_features)
-
-    # Import each file type
-    import_functions = {
-        'cells': ingest_cells,
-        'burgs': ingest_burgs,
-        'routes': ingest_routes,
-        'rivers': ingest_rivers,
-        'markers': ingest_markers,
-    }
-
-    total_rows = 0
-    for file_type, file_path in world_files.items():
-        if file_type in import_functions:
-            try:
-                rows = await import_functions[file_type](file_path, world_id)
-                total_rows += rows
-                logger.info(f"Imported {rows} {file_type} features")
-            except Exception as e:
-                logger.error(f"Failed to import {file_type}: {e}")
-                raise
+    async def run_import(
+        conn: asyncpg.Connection, file_type: str, file_path: Path, world_id: str
+    ) -> Tuple[int, Dict[str, float]]:
+        try:
+            rows, bounds = await ingest(conn, file_type, file_path, world_id)
+        except Exception as e:
+            logger.error(f"Failed to import {file_type}: {e}")
+            raise
+        logger.info(f"Imported {rows} {file_type} features")
+        return rows, bounds
+
+    file_types = [file_type for file_type in world_files if file_type in _TABLES]
+
+    # One connection and one transaction for the whole world: a failed ingest rolls back
+    # the world entry and every table loaded before it, and the import commits once.
+    # Index drops and rebuilds on empty tables happen inside it too, so they can't be lost
+    async with db_manager.transaction() as conn:
+        world_id = await create_world_entry(conn, world_name)
+        results = [
+            await run_import(conn, file_type, world_files[file_type], world_id)
+            for file_type in file_types
+        ]
+        # Bounds were gathered during the ingest pass, so no file is read twice
+        await update_world_bounds(conn, world_id, _merge_bounds(bounds for _, bounds in results))
+    total_rows = sum(rows for rows, _ in results)
 
     logger.info(f"Successfully imported world '{world_name}' with {total_rows} total features")
 
@@ -461,6 +626,12 @@ async def main():
         default="postgresql://localhost/questables",
         help="PostgreSQL database URL"
     )
+    parser.add_argument(
+        "--fast-import",
+        action="store_true",
+        help="Skip synchronous commits "
+             "(a crash right after the import commits may lose it; re-run the import)"
+    )
 
     args = parser.parse_args()
 
@@ -469,7 +640,12 @@ async def main():
     db_manager = DatabaseManager(args.database_url)
 
     try:
-        await db_manager.connect()
+        # Ingests run in order on one shared connection
+        await db_manager.connect(
+            min_size=1,
+            max_size=1,
+            server_settings={'synchronous_commit': 'off'} if args.fast_import else None,
+        )
         await import_world(args.world, args.dir)
     except Exception as e:
         logger.error(f"Import failed: {e}")
@@ -479,5 +655,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional, the default asyncio loop is used when unavailable
+        asyncio.run(main())
+    else:
+        uvloop.run(main())